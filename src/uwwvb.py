@@ -70,21 +70,25 @@ class WWVBDecoder:
 
 def get_am_bcd(seq: list[int], *poslist: int) -> int | None:
     """Convert the bits seq[positions[0]], ... seq[positions[len(positions-1)]] [in MSB order] from BCD to decimal"""
-    pos = list(poslist)[::-1]
-    val = [int(seq[p]) for p in pos]
-    while len(val) % 4 != 0:
-        val.append(0)
+    # Accumulate each BCD digit while walking the positions, least significant
+    # bit first, instead of building a padded list of bits and re-reading it
+    # in nibbles; this keeps allocations down on the microcontroller
     result = 0
     base = 1
-    for i in range(0, len(val), 4):
-        digit = 0
-        for j in range(4):
-            digit += 1 << j if val[i + j] else 0
-        if digit > 9:
-            return None
-        result += digit * base
-        base *= 10
-    return result
+    digit = 0
+    bit = 1
+    for p in poslist[::-1]:
+        if seq[p]:
+            digit += bit
+        bit <<= 1
+        if bit == 16:
+            if digit > 9:
+                return None
+            result += digit * base
+            base *= 10
+            digit = 0
+            bit = 1
+    return result + digit * base
 
 
 def decode_wwvb(  # pylint: disable=too-many-return-statements
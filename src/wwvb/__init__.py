@@ -6,9 +6,11 @@
 #
 # SPDX-License-Identifier: GPL-3.0-only
 
+import array
 import collections
 import datetime
 import enum
+import functools
 import json
 import warnings
 from typing import Dict, Generator, List, Optional, TextIO, Tuple, TypeVar, Union
@@ -56,17 +58,23 @@ def _maybe_warn_update(dt: datetime.date) -> None:
 
 def get_dut1(dt: DateOrDatetime, *, warn_outdated: bool = True) -> float:
     """Return the DUT1 number for the given timestamp"""
-    date = _date(dt)
-    i = (date - iersdata.DUT1_DATA_START).days
+    ordinal = _date(dt).toordinal()
+    if warn_outdated and ordinal >= iersdata.end_ordinal:
+        _maybe_warn_update(dt)
+    return _get_dut1_by_ordinal(ordinal)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_dut1_by_ordinal(ordinal: int) -> float:
+    """Return the DUT1 number for the given proleptic Gregorian ordinal day"""
+    i = ordinal - iersdata.start_ordinal
     if i < 0:
         v = iersdata.DUT1_OFFSETS[0]
     elif i >= len(iersdata.DUT1_OFFSETS):
-        if warn_outdated:
-            _maybe_warn_update(dt)
         v = iersdata.DUT1_OFFSETS[-1]
     else:
         v = iersdata.DUT1_OFFSETS[i]
-    return (ord(v) - ord("k")) / 10.0
+    return v / 10.0
 
 
 def isly(year: int) -> bool:
@@ -608,6 +616,8 @@ class WWVBMinute(_WWVBMinute):
         self, newut1: Optional[int] = None, newls: Optional[bool] = None
     ) -> "WWVBMinute":
         """Return an object representing the next minute"""
+        if self.min < 59:
+            return self._same_hour(self.min + 1, newut1, newls)
         d = self.as_datetime() + datetime.timedelta(minutes=1)
         return self.from_datetime(d, newut1, newls, self)
 
@@ -615,9 +625,19 @@ class WWVBMinute(_WWVBMinute):
         self, newut1: Optional[int] = None, newls: Optional[bool] = None
     ) -> "WWVBMinute":
         """Return an object representing the previous minute"""
+        if self.min > 0:
+            return self._same_hour(self.min - 1, newut1, newls)
         d = self.as_datetime() - datetime.timedelta(minutes=1)
         return self.from_datetime(d, newut1, newls, self)
 
+    def _same_hour(
+        self, minute: int, newut1: Optional[int], newls: Optional[bool]
+    ) -> "WWVBMinute":
+        """Equivalent to from_datetime for another minute within this hour, without the datetime round trip"""
+        if newls is None and newut1 is None:
+            newut1, newls = self._get_dut1_info(self.year, self.days, self)
+        return type(self)(self.year, self.days, self.hour, minute, ut1=newut1, ls=newls)
+
     @classmethod
     def _get_dut1_info(  # pylint: disable=unused-argument
         cls: type, year: int, days: int, old_time: "Optional[WWVBMinute]" = None
@@ -755,28 +775,44 @@ class PhaseModulation(enum.IntEnum):
 class WWVBTimecode:
     """Represent the amplitude and/or phase signal, usually over 1 minute"""
 
-    am: List[AmplitudeModulation]
+    # One signed byte per second; the values are those of AmplitudeModulation
+    am: "array.array[int]"
     phase: List[PhaseModulation]
 
     def __init__(self, sz: int) -> None:
-        self.am = [AmplitudeModulation.UNSET] * sz  # pylint: disable=invalid-name
+        unset = array.array("b", [AmplitudeModulation.UNSET])
+        self.am = unset * sz  # pylint: disable=invalid-name
         self.phase = [PhaseModulation.UNSET] * sz
 
+    def clone(self) -> "WWVBTimecode":
+        """Return an independent copy of this timecode"""
+        result = WWVBTimecode(0)
+        result.am = self.am[:]
+        result.phase = self.phase[:]
+        return result
+
     def _get_am_bcd(self, *poslist: int) -> Optional[int]:
         """Convert the bits seq[positions[0]], ... seq[positions[len(positions-1)]] [in MSB order] from BCD to decimal"""
-        pos = reversed(poslist)
-        val = [bool(self.am[p]) for p in pos]
+        # Accumulate the BCD digits in a single pass over the positions, least
+        # significant bit first, without building any intermediate lists
+        am = self.am
         result = 0
         base = 1
-        for i in range(0, len(val), 4):
-            digit = 0
-            for j, b in enumerate(val[i : i + 4]):
-                digit += b << j
-            if digit > 9:
-                return None
-            result += digit * base
-            base *= 10
-        return result
+        digit = 0
+        bit = 1
+        for p in reversed(poslist):
+            if am[p]:
+                digit += bit
+            bit <<= 1
+            if bit == 16:
+                if digit > 9:
+                    return None
+                result += digit * base
+                base *= 10
+                digit = 0
+                bit = 1
+        # A partial final digit has at most 3 bits, so it is always valid
+        return result + digit * base
 
     def _put_am_bcd(self, v: int, *poslist: int) -> None:
         """Treating 'poslist' as a sequence of indices, update the AM signal with the value as a BCD number"""
@@ -804,7 +840,7 @@ class WWVBTimecode:
         if undefined:
             warnings.warn(f"am{undefined} is unset")
 
-        def convert_one(am: AmplitudeModulation, phase: PhaseModulation) -> str:
+        def convert_one(am: int, phase: PhaseModulation) -> str:
             if phase is PhaseModulation.UNSET:
                 return ("0", "1", "2", "?")[am]
             if phase:
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: GPL-3.0-only
 """A stateful decoder of WWVB signals"""
 
+import array
 import sys
 from typing import Generator, List, Optional
 
@@ -20,61 +21,75 @@ import wwvb
 # State 4: Decoding a minute, starting in second 1
 #  Second
 
-always_zero = set((4, 10, 11, 14, 20, 21, 34, 35, 44, 54))
+always_zero = frozenset((4, 10, 11, 14, 20, 21, 34, 35, 44, 54))
+
+# The decoder runs once per received symbol, so it works with plain integers
+# and a bitmask of positions instead of enum attributes and set lookups
+ZERO = int(wwvb.AmplitudeModulation.ZERO)
+MARK = int(wwvb.AmplitudeModulation.MARK)
+_AZ_MASK = sum(1 << p for p in always_zero)
 
 
 def wwvbreceive() -> Generator[  # pylint: disable=too-many-branches
-    Optional[wwvb.WWVBTimecode], wwvb.AmplitudeModulation, None
+    Optional[wwvb.WWVBTimecode], int, None
 ]:
     """A stateful decoder of WWVB signals"""
-    minute: List[wwvb.AmplitudeModulation] = []
+    minute: List[int] = []
     state = 1
+    # Local aliases for the per-symbol loop
+    mark = MARK
+    zero = ZERO
+    az_mask = _AZ_MASK
 
     value = yield None
     while True:
         # print(state, value, len(minute), "".join(str(int(i)) for i in minute))
-        if state == 1:
-            minute = []
-            if value == wwvb.AmplitudeModulation.MARK:
-                state = 2
-            value = yield None
-
-        elif state == 2:
-            if value == wwvb.AmplitudeModulation.MARK:
-                state = 3
-            else:
-                state = 1
-            value = yield None
-
-        elif state == 3:
-            if value != wwvb.AmplitudeModulation.MARK:
-                state = 4
-                minute = [wwvb.AmplitudeModulation.MARK, value]
-            value = yield None
-
-        else:  #  state == 4:
+        # Most symbols arrive while decoding a minute, so check that state first
+        if state == 4:
             minute.append(value)
-            if len(minute) % 10 == 0 and value != wwvb.AmplitudeModulation.MARK:
-                # print("MISSING MARK", len(minute), "".join(str(int(i)) for i in minute))
+            pos = len(minute)
+            # Common case: a symbol that is valid at this position, mid-minute
+            if (
+                pos != 60
+                and (pos % 10 == 0) == (value == mark)
+                and (value == zero or not (az_mask >> (pos - 1)) & 1)
+            ):
+                value = yield None
+            elif pos % 10 == 0 and value != mark:
+                # print("MISSING MARK", pos, "".join(str(int(i)) for i in minute))
                 state = 1
-            elif len(minute) % 10 and value == wwvb.AmplitudeModulation.MARK:
+            elif pos % 10 and value == mark:
                 # print("UNEXPECTED MARK")
                 state = 1
-            elif (
-                len(minute) - 1 in always_zero
-                and value != wwvb.AmplitudeModulation.ZERO
-            ):
+            elif (az_mask >> (pos - 1)) & 1 and value != zero:
                 # print("UNEXPECTED NONZERO")
                 state = 1
-            elif len(minute) == 60:
+            else:  # pos == 60
                 # print("FULL MINUTE")
                 tc = wwvb.WWVBTimecode(60)
-                tc.am[:] = minute
+                tc.am[:] = array.array("b", minute)
                 minute = []
                 state = 2
                 value = yield tc
+
+        elif state == 1:
+            minute = []
+            if value == mark:
+                state = 2
+            value = yield None
+
+        elif state == 2:
+            if value == mark:
+                state = 3
             else:
-                value = yield None
+                state = 1
+            value = yield None
+
+        else:  # state == 3:
+            if value != mark:
+                state = 4
+                minute = [mark, value]
+            value = yield None
 
 
 def main() -> None:
@@ -17,7 +17,7 @@ def main() -> None:
     """Print the table of historical DUT1 values"""
     date = DUT1_DATA_START
     for key, it in groupby(DUT1_OFFSETS):
-        dut1_ms = (ord(key) - ord("k")) / 10.0
+        dut1_ms = key / 10.0
         count = len(list(it))
         end = date + timedelta(days=count - 1)
         dut1_next = wwvb.get_dut1(date + timedelta(days=count), warn_outdated=False)
@@ -6,13 +6,29 @@
 #
 # SPDX-License-Identifier: GPL-3.0-only
 
+import array
 import datetime
 import os
+from typing import Any, Dict
 
 import platformdirs
 
-__all__ = ["DUT1_DATA_START", "DUT1_OFFSETS", "start", "span", "end"]
-from .iersdata_dist import DUT1_DATA_START, DUT1_OFFSETS
+from . import iersdata_dist
+
+__all__ = [
+    "DUT1_DATA_START",
+    "DUT1_OFFSETS",
+    "start",
+    "span",
+    "end",
+    "start_ordinal",
+    "end_ordinal",
+]
+
+_data: Dict[str, Any] = {
+    "DUT1_DATA_START": iersdata_dist.DUT1_DATA_START,
+    "DUT1_OFFSETS": iersdata_dist.DUT1_OFFSETS,
+}
 
 for location in [
     platformdirs.user_data_dir("wwvbpy", "unpythonic.net"),
@@ -21,11 +37,20 @@ for location in [
     filename = os.path.join(location, "wwvbpy_iersdata.py")
     if os.path.exists(filename):
         with open(filename, encoding="utf-8") as f:
-            exec(f.read(), globals(), globals())  # pylint: disable=exec-used
+            exec(f.read(), _data)  # pylint: disable=exec-used
         break
 
+DUT1_DATA_START: datetime.date = _data["DUT1_DATA_START"]
+# The data files encode each day's offset as a letter, with "k" meaning 0.0s.
+# Decode them once into signed tenths of a second, one byte per day, so that
+# lookups are a plain index.
+DUT1_OFFSETS = array.array("b", [ord(c) - ord("k") for c in _data["DUT1_OFFSETS"]])
+
 start = datetime.datetime.combine(DUT1_DATA_START, datetime.time()).replace(
     tzinfo=datetime.timezone.utc
 )
 span = datetime.timedelta(days=len(DUT1_OFFSETS))
 end = start + span
+# Proleptic Gregorian ordinals of the first day covered and the first day after
+start_ordinal = DUT1_DATA_START.toordinal()
+end_ordinal = start_ordinal + len(DUT1_OFFSETS)
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""Test parts of the IERS data updater"""
+
+# SPDX-FileCopyrightText: 2021 Jeff Epler
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import http.server
+import itertools
+import threading
+import unittest
+from typing import List
+
+import wwvb.updateiers
+
+
+class CSVHandler(http.server.BaseHTTPRequestHandler):
+    """Serve a fixed CSV body"""
+
+    body = b""
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Send the body, with no transfer encoding"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args: object) -> None:  # pylint: disable=arguments-differ
+        """Keep the test output quiet"""
+
+
+class TestOpenLines(unittest.TestCase):
+    """Test streaming lines over http"""
+
+    def setUp(self) -> None:
+        self.server = http.server.HTTPServer(("127.0.0.1", 0), CSVHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/data.csv"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+
+    def check_lines(self, lines: List[str]) -> None:
+        """Serve lines with CRLF endings and check they stream back intact"""
+        CSVHandler.body = "".join(f"{line}\r\n" for line in lines).encode("utf-8")
+        with wwvb.updateiers._open_lines(  # pylint: disable=protected-access
+            self.url
+        ) as f:
+            self.assertEqual([line.rstrip("\r\n") for line in f], lines)
+
+    def test_small(self) -> None:
+        """A response shorter than one read buffer"""
+        self.check_lines(["MJD;UT1-UTC", "41684;0.8075"])
+
+    def test_large(self) -> None:
+        """A response spanning many read buffers"""
+        self.check_lines([f"{41684 + i};{i / 10000:.4f}" for i in range(20000)])
+
+
+class TestRunLengths(unittest.TestCase):
+    """Test run-length grouping of DUT1 offsets"""
+
+    def test_run_lengths(self) -> None:
+        """Runs match itertools.groupby, including for an empty list"""
+        run_lengths = wwvb.updateiers._run_lengths  # pylint: disable=protected-access
+        for seq in ([], [3], [3, 3], [1, 2, 2, -1, -1, -1, 2]):
+            self.assertEqual(
+                list(run_lengths(seq)),
+                [(k, len(list(g))) for k, g in itertools.groupby(seq)],
+            )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
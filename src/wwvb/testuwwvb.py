@@ -121,7 +121,7 @@ class WWVBRoundtrip(unittest.TestCase):
             for _ in range(480)
         ]
         timecode = minute.as_timecode()
-        test_input = junk + [wwvb.AmplitudeModulation.MARK] + timecode.am
+        test_input = junk + [wwvb.AmplitudeModulation.MARK] + list(timecode.am)
         decoder = uwwvb.WWVBDecoder()
         for code in test_input[:-1]:
             decoded = decoder.update(code)
@@ -6,20 +6,53 @@
 #
 # SPDX-License-Identifier: GPL-3.0-only
 
-import copy
 import datetime
+import functools
 import glob
 import io
+import itertools
 import random
 import sys
 import unittest
-from typing import Optional
+from typing import List, Optional
 
 import uwwvb
 import wwvb
 
 from . import decode, iersdata, tz
 
+TEST_FILES = glob.glob("tests/*")
+
+
+def _pseudorandom_symbols(seed: int, count: int) -> bytes:
+    """Return a reproducible sequence of pseudorandom amplitude symbols"""
+    r = random.Random(seed)
+    return bytes(
+        r.choice(
+            [
+                wwvb.AmplitudeModulation.MARK,
+                wwvb.AmplitudeModulation.ONE,
+                wwvb.AmplitudeModulation.ZERO,
+            ]
+        )
+        for _ in range(count)
+    )
+
+
+# Noise for WWVBRoundtrip.test_noise
+_NOISE_BYTES = _pseudorandom_symbols(408, 480)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fixture(path: str) -> List[str]:
+    """Read an expected output file, returning its lines without comments"""
+    with open(path, "rt", encoding="utf-8") as f:
+        text = f.read()
+    lines = [line for line in text.split("\n") if not line.startswith("#")]
+    while not lines[0]:
+        del lines[0]
+    return lines
+
 
 class WWVBMinute2k(wwvb.WWVBMinute):
     """Treats the origin of the 2-digit epoch as 2000"""
@@ -35,14 +68,9 @@ class WWVBTestCase(unittest.TestCase):
 
     def test_cases(self) -> None:
         """Generate a test case for each expected output in tests/"""
-        for test in glob.glob("tests/*"):
+        for test in TEST_FILES:
             with self.subTest(test=test):
-                with open(test, "rt", encoding="utf-8") as f:
-                    text = f.read()
-                lines = [line for line in text.split("\n") if not line.startswith("#")]
-                while not lines[0]:
-                    del lines[0]
-                text = "\n".join(lines)
+                lines = _load_fixture(test)
                 header = lines[0].split()
                 timestamp = " ".join(header[:10])
                 options = header[10:]
@@ -76,8 +104,7 @@ class WWVBTestCase(unittest.TestCase):
                     all_timecodes=all_timecodes,
                     file=result,
                 )
-                result_str = result.getvalue()
-                self.assertEqual(text, result_str)
+                self.assertListEqual(lines, result.getvalue().split("\n"))
 
 
 class WWVBRoundtrip(unittest.TestCase):
@@ -90,7 +117,8 @@ class WWVBRoundtrip(unittest.TestCase):
         )
         decoder = decode.wwvbreceive()
         next(decoder)
-        decoder.send(wwvb.AmplitudeModulation.MARK)
+        send = decoder.send
+        send(wwvb.AmplitudeModulation.MARK)
         any_leap_second = False
         for _ in range(20):
             timecode = minute.as_timecode()
@@ -98,7 +126,9 @@ class WWVBRoundtrip(unittest.TestCase):
             if len(timecode.am) == 61:
                 any_leap_second = True
             for code in timecode.am:
-                decoded = decoder.send(code) or decoded
+                d = send(code)
+                if d is not None:
+                    decoded = d
             assert decoded
             self.assertEqual(
                 timecode.am[:60],
@@ -127,18 +157,25 @@ class WWVBRoundtrip(unittest.TestCase):
 
     def test_roundtrip(self) -> None:
         """Test that a wide of minutes are correctly decoded by the state-based decoder"""
-        dt = datetime.datetime(1992, 1, 1, 0, 0)
+        start = datetime.datetime(1992, 1, 1, 0, 0)
         delta = datetime.timedelta(
             minutes=915 if sys.implementation.name == "cpython" else 86400 - 915
         )
-        while dt.year < 1993:
+        dts = list(
+            itertools.takewhile(
+                lambda dt: dt.year < 1993,
+                (start + i * delta for i in itertools.count()),
+            )
+        )
+        for dt in dts:
             minute = wwvb.WWVBMinuteIERS.from_datetime(dt)
             assert minute is not None
-            timecode = minute.as_timecode().am
+            tc = minute.as_timecode()
+            timecode = tc.am
             assert timecode
             decoded_minute: Optional[
                 wwvb.WWVBMinute
-            ] = wwvb.WWVBMinuteIERS.from_timecode_am(minute.as_timecode())
+            ] = wwvb.WWVBMinuteIERS.from_timecode_am(tc)
             assert decoded_minute
             decoded = decoded_minute.as_timecode().am
             self.assertEqual(
@@ -146,31 +183,19 @@ class WWVBRoundtrip(unittest.TestCase):
                 decoded,
                 f"Checking equality of minute {minute}: [expected] {timecode} != [actual] {decoded}",
             )
-            dt = dt + delta
 
     def test_noise(self) -> None:
         """Test against pseudorandom noise"""
         minute = wwvb.WWVBMinuteIERS.from_datetime(
             datetime.datetime(1992, 6, 30, 23, 50)
         )
-        r = random.Random(408)
-        junk = [
-            r.choice(
-                [
-                    wwvb.AmplitudeModulation.MARK,
-                    wwvb.AmplitudeModulation.ONE,
-                    wwvb.AmplitudeModulation.ZERO,
-                ]
-            )
-            for _ in range(480)
-        ]
         timecode = minute.as_timecode()
-        test_input = junk + [wwvb.AmplitudeModulation.MARK] + timecode.am
+        test_input = [*_NOISE_BYTES, wwvb.AmplitudeModulation.MARK, *timecode.am]
         decoder = decode.wwvbreceive()
         next(decoder)
-        for code in test_input[:-1]:
-            decoded = decoder.send(code)
-            self.assertIsNone(decoded)
+        self.assertFalse(
+            any(decoder.send(code) is not None for code in test_input[:-1])
+        )
         decoded = decoder.send(wwvb.AmplitudeModulation.MARK)
         assert decoded
         self.assertIsNotNone(decoded)
@@ -189,13 +214,13 @@ class WWVBRoundtrip(unittest.TestCase):
         decoded = wwvb.WWVBMinute.from_timecode_am(timecode)
         self.assertIsNotNone(decoded)
         for position in uwwvb.always_mark:
-            test_input = copy.deepcopy(timecode)
+            test_input = timecode.clone()
             for noise in (0, 1):
                 test_input.am[position] = wwvb.AmplitudeModulation(noise)
                 decoded = wwvb.WWVBMinute.from_timecode_am(test_input)
                 self.assertIsNone(decoded)
         for position in uwwvb.always_zero:
-            test_input = copy.deepcopy(timecode)
+            test_input = timecode.clone()
             for noise in (1, 2):
                 test_input.am[position] = wwvb.AmplitudeModulation(noise)
                 decoded = wwvb.WWVBMinute.from_timecode_am(test_input)
@@ -203,14 +228,14 @@ class WWVBRoundtrip(unittest.TestCase):
         for i in range(8):
             if i in (0b101, 0b010):  # Test the 6 impossible bit-combos
                 continue
-            test_input = copy.deepcopy(timecode)
+            test_input = timecode.clone()
             test_input.am[36] = wwvb.AmplitudeModulation(i & 1)
             test_input.am[37] = wwvb.AmplitudeModulation((i >> 1) & 1)
             test_input.am[38] = wwvb.AmplitudeModulation((i >> 2) & 1)
             decoded = wwvb.WWVBMinute.from_timecode_am(test_input)
             self.assertIsNone(decoded)
         # Invalid year-day
-        test_input = copy.deepcopy(timecode)
+        test_input = timecode.clone()
         test_input.am[22] = wwvb.AmplitudeModulation(1)
         test_input.am[23] = wwvb.AmplitudeModulation(1)
         test_input.am[25] = wwvb.AmplitudeModulation(1)
@@ -235,7 +260,7 @@ class WWVBRoundtrip(unittest.TestCase):
             [50, 51, 52, 53],  # ones dut1
         ]:
             with self.subTest(test=poslist):
-                test_input = copy.deepcopy(timecode)
+                test_input = timecode.clone()
                 for pi in poslist:
                     test_input.am[pi] = wwvb.AmplitudeModulation(1)
                 decoded = wwvb.WWVBMinute.from_timecode_am(test_input)
@@ -248,6 +273,20 @@ class WWVBRoundtrip(unittest.TestCase):
         )
         self.assertEqual(minute, minute.next_minute().previous_minute())
 
+        # Crossing an hour boundary
+        minute = wwvb.WWVBMinuteIERS.from_datetime(
+            datetime.datetime(1992, 6, 30, 23, 0)
+        )
+        self.assertEqual(minute, minute.previous_minute().next_minute())
+
+        # Explicit ut1 and ls information
+        self.assertEqual(
+            minute.next_minute(newut1=-300, newls=True),
+            wwvb.WWVBMinuteIERS.from_datetime(
+                datetime.datetime(1992, 6, 30, 23, 1), newut1=-300, newls=True
+            ),
+        )
+
     def test_timecode_str(self) -> None:
         """Test the str() and repr() methods"""
         minute = wwvb.WWVBMinuteIERS.from_datetime(
@@ -6,13 +6,24 @@
 
 """Update the DUT1 and LS data based on online sources"""
 
+import contextlib
 import csv
 import datetime
 import io
 import itertools
+import operator
 import os
 import pathlib
-from typing import Callable, List, Optional
+from typing import (
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import bs4
 import click
@@ -39,57 +50,81 @@ if os.path.exists("finals2000A.all.csv"):
 NIST_URL = "https://www.nist.gov/pml/time-and-frequency-division/atomic-standards/leap-second-and-ut1-utc-information"
 
 
-def _get_text(url: str) -> str:
-    """Get a local file or a http/https URL"""
+@contextlib.contextmanager
+def _open_lines(url: str) -> Iterator[Iterable[str]]:
+    """Open a local file or a http/https URL, streaming its lines"""
     if url.startswith("http"):
-        with requests.get(url) as response:
-            return response.text
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # urllib3 closes the stream itself at EOF, which breaks the
+            # TextIOWrapper's final read
+            response.raw.auto_close = False
+            raw = cast(BinaryIO, response.raw)
+            yield io.TextIOWrapper(
+                raw, encoding=response.encoding or "utf-8", newline=""
+            )
     else:
-        return open(url, encoding="utf-8").read()
+        with open(url, encoding="utf-8", newline="") as f:
+            yield f
+
+
+def _run_lengths(seq: List[int]) -> Iterator[Tuple[int, int]]:
+    """Return (value, count) for each run of equal values in seq"""
+    if not seq:
+        return iter(())
+    # Find the index where each run starts, without a per-item Python loop
+    changes = map(operator.ne, seq, seq[1:])
+    starts = [0, *itertools.compress(itertools.count(1), changes), len(seq)]
+    return ((seq[a], b - a) for a, b in zip(starts, starts[1:]))
 
 
 def update_iersdata(  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
     target_file: str,
+    html_parser: str = "html.parser",
 ) -> None:
-    """Update iersdata.py"""
+    """Update iersdata.py
+
+    html_parser is the BeautifulSoup tree builder used on the NIST page;
+    "lxml" is faster but must be installed separately."""
 
     offsets: List[int] = []
-    iersdata_text = _get_text(IERS_URL)
-    for r in csv.DictReader(io.StringIO(iersdata_text), delimiter=";"):
-        jd = float(r["MJD"])
-        offs_str = r["UT1-UTC"]
-        if not offs_str:
-            break
-        offs = int(round(float(offs_str) * 10))
-        if not offsets:
-            table_start = datetime.date(1858, 11, 17) + datetime.timedelta(jd)
-
-            when = min(datetime.date(1972, 1, 1), table_start)
-            # iers bulletin A doesn't cover 1972, so fake data for those
-            # leap seconds
-            while when < datetime.date(1972, 7, 1):
-                offsets.append(-2)
-                when = when + datetime.timedelta(days=1)
-            while when < datetime.date(1972, 11, 1):
-                offsets.append(8)
-                when = when + datetime.timedelta(days=1)
-            while when < datetime.date(1972, 12, 1):
-                offsets.append(0)
-                when = when + datetime.timedelta(days=1)
-            while when < datetime.date(1973, 1, 1):
-                offsets.append(-2)
-                when = when + datetime.timedelta(days=1)
-            while when < table_start:
-                offsets.append(8)
-                when = when + datetime.timedelta(days=1)
-
-            table_start = min(datetime.date(1972, 1, 1), table_start)
-
-        offsets.append(offs)
+    with _open_lines(IERS_URL) as lines:
+        reader = csv.reader(lines, delimiter=";")
+        header = next(reader)
+        mjd_col = header.index("MJD")
+        offs_col = header.index("UT1-UTC")
+        for r in reader:
+            if not r:
+                continue
+            offs_str = r[offs_col] if len(r) > offs_col else ""
+            if not offs_str:
+                break
+            if not offsets:
+                jd = float(r[mjd_col])
+                table_start = datetime.date(1858, 11, 17) + datetime.timedelta(jd)
+
+                when = min(datetime.date(1972, 1, 1), table_start)
+                # iers bulletin A doesn't cover 1972, so fake data for those
+                # leap seconds
+                for until, fake in (
+                    (datetime.date(1972, 7, 1), -2),
+                    (datetime.date(1972, 11, 1), 8),
+                    (datetime.date(1972, 12, 1), 0),
+                    (datetime.date(1973, 1, 1), -2),
+                    (table_start, 8),
+                ):
+                    if when < until:
+                        offsets.extend([fake] * (until - when).days)
+                        when = until
+
+                table_start = min(datetime.date(1972, 1, 1), table_start)
+
+            offsets.append(int(round(float(offs_str) * 10)))
 
     wwvb_text = requests.get(NIST_URL).text
-    wwvb_data = bs4.BeautifulSoup(wwvb_text, features="html.parser")
-    wwvb_dut1_table = wwvb_data.findAll("table")[2]
+    wwvb_data = bs4.BeautifulSoup(wwvb_text, features=html_parser)
+    wwvb_dut1_table = wwvb_data.find_all("table", limit=3)[2]
     assert wwvb_dut1_table
     meta = wwvb_data.find("meta", property="article:modified_time")
     assert isinstance(meta, bs4.Tag)
@@ -106,8 +141,8 @@ def update_iersdata(  # pylint: disable=too-many-locals, too-many-branches, too-
 
     wwvb_dut1: Optional[int] = None
     wwvb_start: Optional[datetime.date] = None
-    for row in wwvb_dut1_table.findAll("tr")[1:][::-1]:
-        cells = row.findAll("td")
+    for row in wwvb_dut1_table.find_all("tr")[1:][::-1]:
+        cells = row.find_all("td", limit=3)
         when = datetime.datetime.strptime(cells[0].text, "%Y-%m-%d").date()
         dut1 = cells[2].text.replace("s", "").replace(" ", "")
         dut1 = int(round(float(dut1) * 10))
@@ -152,28 +187,28 @@ def update_iersdata(  # pylint: disable=too-many-locals, too-many-branches, too-
         code(
             f"DUT1_OFFSETS = str( # {table_start.year:04d}{table_start.month:02d}{table_start.day:02d}"
         )
-        line = ""
+        parts: List[str] = []
+        parts_len = 0
         j = 0
 
-        for val, it in itertools.groupby(offsets):
-            part = ""
+        def flush() -> None:
+            d = table_start + datetime.timedelta(j - 1)
+            line = "".join(parts)
+            code(f"    {line:<60s} # {d.year:04d}{d.month:02d}{d.day:02d}")
+
+        for val, sz in _run_lengths(offsets):
             ch = chr(ord("a") + val + 10)
-            sz = len(list(it))
+            part = ch if sz < 2 else f"{ch}*{sz}"
             if j:
-                part = part + "+"
-            if sz < 2:
-                part = part + ch
-            else:
-                part = part + f"{ch}*{sz}"
+                part = "+" + part
             j += sz
-            if len(line + part) > 60:
-                d = table_start + datetime.timedelta(j - 1)
-                code(f"    {line:<60s} # {d.year:04d}{d.month:02d}{d.day:02d}")
-                line = part
-            else:
-                line = line + part
-        d = table_start + datetime.timedelta(j - 1)
-        code(f"    {line:<60s} # {d.year:04d}{d.month:02d}{d.day:02d}")
+            if parts_len + len(part) > 60:
+                flush()
+                parts.clear()
+                parts_len = 0
+            parts.append(part)
+            parts_len += len(part)
+        flush()
         code(")")
     table_end = table_start + datetime.timedelta(len(offsets) - 1)
     if OLD_TABLE_START:
@@ -197,11 +232,17 @@ def iersdata_path(callback: Callable[[str, str], str]) -> str:
 @click.option(
     "--site", "location", flag_value=iersdata_path(platformdirs.site_data_dir)
 )
-def main(location: str) -> None:
+@click.option(
+    "--html-parser",
+    default="html.parser",
+    show_default=True,
+    help="BeautifulSoup parser for the NIST page, e.g. lxml",
+)
+def main(location: str, html_parser: str) -> None:
     """Update DUT1 data"""
     print("will write to", location)
     os.makedirs(os.path.dirname(location), exist_ok=True)
-    update_iersdata(location)
+    update_iersdata(location, html_parser)
 
 
 if __name__ == "__main__":
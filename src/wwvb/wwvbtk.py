@@ -32,7 +32,7 @@ def main() -> None:
             key = tt.tm_year, tt.tm_yday, tt.tm_hour, tt.tm_min
             timecode = wwvb.WWVBMinuteIERS(*key).as_timecode()
             for i, code in enumerate(timecode.am):
-                yield timestamp + i, code
+                yield timestamp + i, wwvb.AmplitudeModulation(code)
             timestamp = timestamp + 60
 
     def wwvbsmarttick() -> Generator[